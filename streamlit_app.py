@@ -1,13 +1,38 @@
 import streamlit as st
-import json
+import atexit
+import calendar
+import copy
+import glob
+import orjson
 import os
-from datetime import datetime, timedelta
+import threading
+import time
+import uuid
+from collections import defaultdict
+from datetime import date, datetime
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import pyarrow as pa
+import pyarrow.parquet as pq
 
 # --- CONFIGURATION & DATA PERSISTENCE ---
 # Use a relative path for the data file.
 DATA_FILE = "sweety_stash_data.json"
+# Expenses live in an append-only JSON Lines sidecar, one transaction per line,
+# which is periodically compacted into a columnar Parquet snapshot.
+EXPENSES_FILE = "sweety_stash_expenses.jsonl"
+EXPENSES_SNAPSHOT_FILE = "sweety_stash_expenses.parquet"
+# The log is renamed to "<log>.<id>.compacting" while being folded into the
+# snapshot; the id is unique per compaction
+EXPENSES_COMPACTING_PATTERN = EXPENSES_FILE + ".*.compacting"
+EXPENSES_COMPACT_AFTER = 500  # Log lines to accumulate before compacting
+# Snapshot metadata key recording that inline expenses were moved into it
+LEGACY_MIGRATED_KEY = b"sweety_stash.legacy_migrated"
+# Snapshot metadata key naming the last renamed log folded into it
+COMPACTED_LOG_KEY = b"sweety_stash.compacted_log"
+FLUSH_INTERVAL_SECONDS = 2.0  # Quiet period before pending state is written
+FLUSH_POLL_SECONDS = 0.5  # How often the flusher checks for pending state
+FIGURE_CACHE_ENTRIES = 32  # Chart figures kept per chart; oldest are evicted
 PET_NAME_DEFAULT = "Sweety"
 EXPENSE_CATEGORIES = [
     "Food", "Transport", "Shopping", "Entertainment", "Utilities", "Other"
@@ -22,34 +47,255 @@ st.set_page_config(page_title="Sweety Stash",
 # --- UTILITY FUNCTIONS ---
 
 
-def _load_data():
-    """Loads application data from the JSON file."""
+@st.cache_resource(show_spinner=False)
+def _get_expenses_lock():
+    """Returns the process-wide lock serializing writes to the expense files."""
+    return threading.Lock()
+
+
+def _read_snapshot():
+    """Returns (expenses, metadata) stored in the Parquet snapshot."""
+    if not os.path.exists(EXPENSES_SNAPSHOT_FILE):
+        return [], {}
+    table = pq.read_table(EXPENSES_SNAPSHOT_FILE)
+    return table.to_pylist(), dict(table.schema.metadata or {})
+
+
+def _write_snapshot(expenses, metadata):
+    """Atomically replaces the Parquet snapshot."""
+    tmp_file = EXPENSES_SNAPSHOT_FILE + ".tmp"
+    table = pa.Table.from_pylist(expenses).replace_schema_metadata(metadata)
+    pq.write_table(table, tmp_file, compression='zstd')
+    os.replace(tmp_file, EXPENSES_SNAPSHOT_FILE)
+
+
+def _parse_log(raw):
+    """Parses expense log bytes, skipping any line that cannot be parsed."""
+    expenses = []
+    for line in raw.splitlines():
+        try:
+            expenses.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            # Blank or partially written line (e.g. interrupted append)
+            continue
+    return expenses
+
+
+def _load_expenses():
+    """Returns the snapshot plus logged expenses, and the number logged."""
+    expenses, _ = _read_snapshot()
+
+    logged = []
+    if os.path.exists(EXPENSES_FILE):
+        with open(EXPENSES_FILE, 'rb') as f:
+            logged = _parse_log(f.read())
+
+    return expenses + logged, len(logged)
+
+
+def _compact_expenses():
+    """Folds the expense log into the Parquet snapshot.
+
+    The log is renamed aside under a unique name first, so nothing appended
+    meanwhile is lost. The snapshot records that name: if the process dies
+    before the renamed log is removed, the next call only removes it rather
+    than adding its lines twice. Callers hold the expenses lock.
+    """
+    leftover = glob.glob(EXPENSES_COMPACTING_PATTERN)
+    if leftover:
+        compacting_file = leftover[0]
+    elif os.path.exists(EXPENSES_FILE):
+        compacting_file = EXPENSES_COMPACTING_PATTERN.replace(
+            "*", uuid.uuid4().hex)
+        os.replace(EXPENSES_FILE, compacting_file)
+    else:
+        return
+
+    snapshot, metadata = _read_snapshot()
+    if metadata.get(COMPACTED_LOG_KEY) != compacting_file.encode():
+        with open(compacting_file, 'rb') as f:
+            logged = _parse_log(f.read())
+        metadata[COMPACTED_LOG_KEY] = compacting_file.encode()
+        _write_snapshot(snapshot + logged, metadata)
+    os.remove(compacting_file)
+
+
+def _migrate_legacy_expenses(legacy_expenses):
+    """Moves expenses stored inline in older data files into the snapshot.
+
+    The snapshot is marked as migrated, so if the data file still holds the
+    expenses on a later load (it could not be rewritten) they are not added
+    a second time.
+    """
+    snapshot, metadata = _read_snapshot()
+    if LEGACY_MIGRATED_KEY in metadata:
+        return False
+    metadata[LEGACY_MIGRATED_KEY] = b"1"
+    _write_snapshot(legacy_expenses + snapshot, metadata)
+    return True
+
+
+def _append_expense(transaction):
+    """Appends a single transaction to the expense log."""
+    try:
+        with _get_expenses_lock(), open(EXPENSES_FILE, 'ab') as f:
+            f.write(orjson.dumps(transaction) + b'\n')
+        _parse_data_files.clear()
+        return True
+    except Exception:
+        st.error("Could not save expense. Check file permissions.")
+        return False
+
+
+def _read_data_file():
+    """Parses the JSON data file, or returns {} to start fresh."""
     if os.path.exists(DATA_FILE):
         try:
-            with open(DATA_FILE, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError, Exception):
+            with open(DATA_FILE, 'rb') as f:
+                return orjson.loads(f.read())
+        except (orjson.JSONDecodeError, FileNotFoundError, Exception):
             # If load fails, return empty dict to start fresh
             return {}
     return {}
 
 
+def _data_files_mtime():
+    """Returns the modification times of the data files (0 if missing)."""
+    return tuple(
+        os.path.getmtime(path) if os.path.exists(path) else 0
+        for path in (DATA_FILE, EXPENSES_SNAPSHOT_FILE, EXPENSES_FILE))
+
+
+@st.cache_resource(show_spinner=False)
+def _parse_data_files(mtimes):
+    """Parses the data files once per version of them on disk.
+
+    Returns (state, expenses, logged_count) and only reads files. The result
+    is shared by every session and must not be mutated; _load_data hands
+    each session its own copy.
+    """
+    expenses, logged_count = _load_expenses()
+    return _read_data_file(), expenses, logged_count
+
+
+def _load_data():
+    """Loads application data from the JSON file and the expense files."""
+    with _get_expenses_lock():
+        # Finish a compaction that was interrupted before loading the log
+        if glob.glob(EXPENSES_COMPACTING_PATTERN):
+            _compact_expenses()
+            _parse_data_files.clear()
+
+        state, expenses, logged_count = _parse_data_files(_data_files_mtime())
+        data = copy.deepcopy(state)
+
+        if logged_count >= EXPENSES_COMPACT_AFTER:
+            _compact_expenses()
+            _parse_data_files.clear()
+
+        # Older data files keep expenses inline; move them into the snapshot
+        # once and rewrite the data file without them right away.
+        legacy_expenses = data.pop("daily_expenses", None)
+        if legacy_expenses is not None:
+            if legacy_expenses and _migrate_legacy_expenses(legacy_expenses):
+                expenses = legacy_expenses + expenses
+            # Write through the flusher's lock so this can't race a background
+            # flush; if it fails, the data stays pending and is retried there
+            flusher = _get_flusher()
+            flusher.mark_dirty(data)
+            flusher.flush()
+            _parse_data_files.clear()
+
+    # Expense dicts are never modified once logged, so sessions can share
+    # them; each session gets its own list to append to.
+    data["daily_expenses"] = list(expenses)
+    return data
+
+
+def _write_data(data):
+    """Atomically writes application state (everything except expenses)."""
+    # Keys starting with "_" are derived at runtime and never persisted.
+    # list() snapshots the items in one step, as the app may be mutating data.
+    state = {
+        k: v
+        for k, v in list(data.items())
+        if k != "daily_expenses" and not k.startswith("_")
+    }
+    tmp_file = DATA_FILE + ".tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(state))
+    os.replace(tmp_file, DATA_FILE)
+
+
+class _StateFlusher:
+    """Writes the latest pending application state from a background thread.
+
+    Saves only record the data as pending; a daemon thread writes it once no
+    save has come in for FLUSH_INTERVAL_SECONDS, so a burst of saves becomes
+    one write. Whatever is still pending is written at exit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending = None
+        self.dirty_at = None
+        self.failed = False
+        threading.Thread(target=self._run, daemon=True).start()
+        atexit.register(self.flush)
+
+    def mark_dirty(self, data):
+        with self._lock:
+            self._pending = data
+            self.dirty_at = time.monotonic()
+
+    def flush(self):
+        with self._lock:
+            if self._pending is None:
+                return
+            try:
+                _write_data(self._pending)
+            except Exception:
+                self.failed = True  # Keep it pending and retry next time
+                return
+            self._pending = None
+            self.dirty_at = None
+            self.failed = False
+
+    def _run(self):
+        while True:
+            time.sleep(FLUSH_POLL_SECONDS)
+            with self._lock:
+                idle = (None if self.dirty_at is None else
+                        time.monotonic() - self.dirty_at)
+            if idle is not None and idle >= FLUSH_INTERVAL_SECONDS:
+                self.flush()
+
+
+@st.cache_resource(show_spinner=False)
+def _get_flusher():
+    """Returns the process-wide state flusher, starting it on first use."""
+    return _StateFlusher()
+
+
 def _save_data(data):
-    """Saves application data to the JSON file."""
-    try:
-        with open(DATA_FILE, 'w') as f:
-            json.dump(data, f, indent=4)
-        return True
-    except Exception:
-        # Streamlit will handle errors more gracefully than just printing
-        st.error("Could not save data. Check file permissions.")
-        return False
+    """Queues application state to be written to the JSON file.
+
+    The write happens later on the flusher thread, so its outcome isn't
+    known here; main() reports failed writes on every rerun until one
+    succeeds.
+    """
+    data.pop("_dirty", None)  # Everything pending is written by the flusher
+    _get_flusher().mark_dirty(data)
+    _parse_data_files.clear()
 
 
 def _initialize_defaults():
     """Initializes default values and loads data into session state."""
     if 'app_data' not in st.session_state:
+        # Write out anything another session still has pending before loading
+        _get_flusher().flush()
         data = _load_data()
+        loaded_keys = len(data)
 
         data.setdefault("monthly_income", 0.0)
         data.setdefault("monthly_savings_goal", 0.0)
@@ -64,47 +310,117 @@ def _initialize_defaults():
         data.setdefault("rewards_unlocked", [])
 
         st.session_state.app_data = data
-        _save_data(data)
+        if len(data) != loaded_keys:
+            data["_dirty"] = True  # main() saves the newly added defaults
+
+
+def _bump_data_version():
+    """Records that expenses or budget changed since the last rerun."""
+    st.session_state.data_version = st.session_state.get("data_version",
+                                                         0) + 1
+
+
+def _today_str():
+    """Returns today's date as "%Y-%m-%d".
+
+    Called once at the start of main() and of each callback, which pass the
+    result on, so a run never mixes two dates.
+    """
+    return datetime.now().strftime("%Y-%m-%d")
+
+
+def _streak_signature(data, today):
+    """Summarizes the state that the streak and reward checks depend on."""
+    return (len(data["daily_expenses"]),
+            st.session_state.get("data_version", 0), data["last_streak_date"],
+            today)
 
 
 # --- CORE LOGIC FUNCTIONS ---
 
 
-def get_financial_summary(data):
+def _expense_arrays(daily_expenses):
+    """Returns (amounts, dates, big) NumPy columns of the expense log.
+
+    The columns are sorted by date so months can be located with a binary
+    search. They are cached in session state and rebuilt only when the
+    number of logged expenses changes.
+    """
+    n = len(daily_expenses)
+    cached = st.session_state.get("_expense_arrays")
+    if cached is None or cached[0] != n:
+        amounts = np.fromiter((e["amount"] for e in daily_expenses),
+                              dtype=np.float64,
+                              count=n)
+        # An explicit format takes the fast C parser; cache=True parses each
+        # distinct date string once (many expenses share a date)
+        dates = pd.to_datetime([e["date"] for e in daily_expenses],
+                               format="%Y-%m-%d",
+                               cache=True).values.astype("datetime64[D]")
+        big = np.fromiter((e["is_big_purchase"] for e in daily_expenses),
+                          dtype=np.bool_,
+                          count=n)
+        # Appends are already in date order; only edited logs need sorting
+        if np.any(dates[1:] < dates[:-1]):
+            order = np.argsort(dates, kind="stable")
+            amounts, dates, big = amounts[order], dates[order], big[order]
+        cached = (n, amounts, dates, big)
+        st.session_state["_expense_arrays"] = cached
+    return cached[1:]
+
+
+def _month_totals(data, month):
+    """Returns the running {"total", "days"} spending totals for a month.
+
+    Totals exclude big purchases and are updated incrementally by
+    log_expense_callback; a month not seen yet this session is computed
+    once from the expense log.
+    """
+    month_totals = data.setdefault("_month_totals", {})
+    if month not in month_totals:
+        amounts, dates, big = _expense_arrays(data["daily_expenses"])
+        # Binary search for the month's first day and the next month's
+        month_start = np.datetime64(month, "M")
+        bounds = np.array([month_start,
+                           month_start + 1]).astype("datetime64[D]")
+        lo, hi = dates.searchsorted(bounds)
+        keep = ~big[lo:hi]
+        month_amounts, month_dates = amounts[lo:hi][keep], dates[lo:hi][keep]
+        # Sum per day: group the month's dates and add up their amounts
+        days, day_index = np.unique(month_dates, return_inverse=True)
+        day_sums = np.bincount(day_index,
+                               weights=month_amounts,
+                               minlength=days.size)
+        month_totals[month] = {
+            "total": float(month_amounts.sum()),
+            "days": dict(zip(np.datetime_as_string(days), day_sums.tolist()))
+        }
+    return month_totals[month]
+
+
+def get_financial_summary(data, today):
     """Calculates all key financial metrics."""
     income = data["monthly_income"]
     fixed = sum(data["fixed_expenses"].values())
     goal = data["monthly_savings_goal"]
 
-    today = datetime.now().strftime("%Y-%m-%d")
-    current_month = datetime.now().strftime("%Y-%m")
+    current_month = today[:7]
 
-    # Use a DataFrame for efficient calculations
-    df = pd.DataFrame(data["daily_expenses"])
-
-    if df.empty:
+    # Spent this month and today (excluding big purchases)
+    if not data["daily_expenses"]:
+        # Nothing logged yet (e.g. first run): skip the expense aggregation
         total_spent = 0.0
         todays_spent = 0.0
     else:
-        df['date_obj'] = pd.to_datetime(df['date'])
-
-        # Expenses this month (excluding big purchases)
-        expenses_this_month = df[df['date_obj'].dt.strftime('%Y-%m') ==
-                                 current_month]
-        total_spent = expenses_this_month[
-            ~expenses_this_month['is_big_purchase']]['amount'].sum()
-
-        # Spent today (excluding big purchases)
-        todays_expenses = df[df['date'] == today]
-        todays_spent = todays_expenses[~todays_expenses['is_big_purchase']][
-            'amount'].sum()
+        month = _month_totals(data, current_month)
+        total_spent = month["total"]
+        todays_spent = month["days"].get(today, 0.0)
 
     # Remaining days calculation
-    now = datetime.now()
+    today_date = date.fromisoformat(today)
     # Find the last day of the current month
-    next_month = now.replace(day=28) + timedelta(days=4)
-    last_day = next_month - timedelta(days=next_month.day)
-    remaining_days = max(1, (last_day - now).days +
+    last_day = calendar.monthrange(today_date.year, today_date.month)[1]
+    remaining_days = max(1, last_day - today_date.day +
                          1)  # Ensure at least 1 day remaining
 
     disposable = income - fixed - goal
@@ -154,19 +470,18 @@ def get_pet_status(data, financials):
     }
 
 
-def check_daily_reset(data):
+def check_daily_reset(data, today):
     """Resets daily treat status and saves the updated state."""
-    today = datetime.now().strftime("%Y-%m-%d")
     if data.get("last_treat_date") != today:
         data["daily_treat_given"] = False
         data["last_treat_date"] = today
+        data["_dirty"] = True
         return True
     return False
 
 
-def update_streak(data, todays_savings):
+def update_streak(data, todays_savings, today):
     """Updates the saving streak based on today's surplus."""
-    today = datetime.now().strftime("%Y-%m-%d")
     streak = data["saving_streak"]
     last = data["last_streak_date"]
 
@@ -174,10 +489,11 @@ def update_streak(data, todays_savings):
         if last != today:
             if last:
                 # Check if it's the day immediately following the last streak day
-                last_dt = datetime.strptime(last, "%Y-%m-%d")
-                if (datetime.now().date() - last_dt.date()).days == 1:
+                days_since = (date.fromisoformat(today) -
+                              date.fromisoformat(last)).days
+                if days_since == 1:
                     data["saving_streak"] += 1
-                elif (datetime.now().date() - last_dt.date()).days > 1:
+                elif days_since > 1:
                     data["saving_streak"] = 1  # Streak broken, restart
             else:
                 data["saving_streak"] = 1  # Start new streak
@@ -188,6 +504,8 @@ def update_streak(data, todays_savings):
         data[
             "last_streak_date"] = today  # Reset last streak date to today to prevent immediate re-breaking on refresh
 
+    if (data["saving_streak"], data["last_streak_date"]) != (streak, last):
+        data["_dirty"] = True
     return data["saving_streak"]
 
 
@@ -205,6 +523,8 @@ def check_rewards(data):
         new_reward = "Monthly Vacation"
 
     data["rewards_unlocked"] = rewards
+    if new_reward:
+        data["_dirty"] = True
     return new_reward
 
 
@@ -219,18 +539,28 @@ def log_expense_callback(amount, category, description, is_big_purchase):
         st.error("Expense amount must be positive.")
         return
 
+    today = _today_str()
     transaction = {
-        "date": datetime.now().strftime("%Y-%m-%d"),
+        "date": today,
         "amount": float(amount),
         "category": category,
         "description": description,
         "is_big_purchase": is_big_purchase
     }
+    # Fetch the month's running totals before appending so it isn't counted twice
+    month = _month_totals(data, today[:7])
     data["daily_expenses"].append(transaction)
+    _append_expense(transaction)
+    st.session_state.pop("_expense_arrays", None)
+    if not is_big_purchase:
+        month["total"] += transaction["amount"]
+        month["days"][today] = month["days"].get(today,
+                                                 0.0) + transaction["amount"]
+    _bump_data_version()
 
     # Recalculate financial summary to get new savings value for streak update
-    financials = get_financial_summary(data)
-    update_streak(data, financials["todays_savings"])
+    financials = get_financial_summary(data, today)
+    update_streak(data, financials["todays_savings"], today)
     new_reward = check_rewards(data)
 
     _save_data(data)
@@ -259,6 +589,7 @@ def update_budget_callback(income, goal, fixed_expenses):
     data["fixed_expenses"] = fixed_expenses
 
     _save_data(data)
+    _bump_data_version()
     st.session_state.app_data = data
     st.toast("Budget updated successfully!", icon="📝")
 
@@ -270,11 +601,17 @@ def give_treat_callback():
         st.error(f"{data['pet_name']} already got a treat today!")
         return
 
-    financials = get_financial_summary(data)
+    today = _today_str()
+    # Reuse the summary main() rendered this button with, but only if it was
+    # computed today; otherwise recompute (cheap with running month totals)
+    last_date, financials = st.session_state.get("_last_financials",
+                                                 (None, None))
+    if last_date != today:
+        financials = get_financial_summary(data, today)
 
     if financials["todays_savings"] >= 0:
         data["daily_treat_given"] = True
-        data["last_treat_date"] = datetime.now().strftime("%Y-%m-%d")
+        data["last_treat_date"] = today
         _save_data(data)
         st.session_state.app_data = data
         st.toast(f"You gave {data['pet_name']} a treat! 😻", icon="🦴")
@@ -287,24 +624,29 @@ def give_treat_callback():
 # --- VISUALIZATION ---
 
 
-def generate_spending_chart(daily_expenses):
+def generate_spending_chart(daily_expenses, current_month):
     """Generates a pie chart of spending by category for the current month."""
     if not daily_expenses:
         return None
 
-    df = pd.DataFrame(daily_expenses)
-    df['date_obj'] = pd.to_datetime(df['date'])
-    current_month = datetime.now().strftime("%Y-%m")
+    # Sum by category, excluding big purchases for the main pie chart
+    totals = defaultdict(float)
+    for e in daily_expenses:
+        if not e["is_big_purchase"] and e["date"].startswith(current_month):
+            totals[e["category"]] += e["amount"]
+
+    if not totals:
+        return None
 
-    df_current_month = df[df['date_obj'].dt.strftime('%Y-%m') == current_month]
+    return _spending_pie(tuple(sorted(totals.items())))
 
-    # Group by category, excluding big purchases for the main pie chart
-    df_grouped = df_current_month[
-        ~df_current_month['is_big_purchase']].groupby(
-            'category')['amount'].sum().reset_index()
 
-    if df_grouped.empty:
-        return None
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _spending_pie(category_totals):
+    """Builds the spending pie chart from (category, amount) pairs."""
+    import plotly.express as px  # Heavy import, deferred until a chart is drawn
+
+    df_grouped = pd.DataFrame(category_totals, columns=['category', 'amount'])
 
     fig = px.pie(
         df_grouped,
@@ -323,12 +665,19 @@ def generate_extra_goals_chart(extra_goals):
     if not extra_goals:
         return None
 
-    goals_list = []
-    for name, data in extra_goals.items():
-        # Use .get() with default values to prevent KeyError if the data structure is inconsistent.
-        current_saved = data.get('current', 0.0)
-        target = data.get('target', 0.0)
+    # Use .get() with default values to prevent KeyError if the data structure is inconsistent.
+    goals = tuple((name, data.get('current', 0.0), data.get('target', 0.0))
+                  for name, data in extra_goals.items())
+    return _extra_goals_bar(goals)
+
+
+@st.cache_data(show_spinner=False, max_entries=FIGURE_CACHE_ENTRIES)
+def _extra_goals_bar(goals):
+    """Builds the extra goals bar chart from (name, current, target) triples."""
+    import plotly.express as px  # Heavy import, deferred until a chart is drawn
 
+    goals_list = []
+    for name, current_saved, target in goals:
         # Prevent division by zero
         progress = (current_saved / target) * 100 if target > 0 else 0
 
@@ -374,18 +723,30 @@ def main():
     _initialize_defaults()
     data = st.session_state.app_data
 
-    # Check for daily reset and update data if necessary
-    if check_daily_reset(data):
-        _save_data(data)
-        st.session_state.app_data = data  # Update session state after save
+    # Compute the date once per rerun and pass it to the helpers below
+    today = _today_str()
 
-    financials = get_financial_summary(data)
+    # Check for daily reset (marks data dirty if anything was reset)
+    check_daily_reset(data, today)
+
+    financials = get_financial_summary(data, today)
+    st.session_state["_last_financials"] = (today, financials)
     pet_status = get_pet_status(data, financials)
 
-    # Run streak check again in main loop to catch today's new logs
-    update_streak(data, financials["todays_savings"])
-    check_rewards(data)  # Check rewards after streak update
-    _save_data(data)  # Save state after streak/reward check
+    # Run streak check again in main loop to catch today's new logs, but only
+    # when expenses/budget changed or a new day started since the last check
+    if st.session_state.get("_last_sig") != _streak_signature(data, today):
+        update_streak(data, financials["todays_savings"], today)
+        check_rewards(data)  # Check rewards after streak update
+        st.session_state._last_sig = _streak_signature(data, today)
+
+    # Save at most once per rerun, and only if something actually changed
+    if data.pop("_dirty", False):
+        _save_data(data)
+
+    if _get_flusher().failed:
+        # Background writes can't show errors themselves, so report them here
+        st.error("Could not save data. Check file permissions.")
 
     st.title(f"{pet_status['image']} {data['pet_name']}'s Stash")
 
@@ -457,7 +818,7 @@ def main():
 
     with tab1:
         st.subheader("Current Month's Spending")
-        chart = generate_spending_chart(data['daily_expenses'])
+        chart = generate_spending_chart(data['daily_expenses'], today[:7])
         if chart:
             st.plotly_chart(chart, use_container_width=True)
         else:
@@ -528,11 +889,15 @@ def main():
     with st.sidebar:
         st.title("⚙️ Budget Settings")
 
-        # Pet Name Change
-        new_pet_name = st.text_input("Change Pet's Name:",
-                                     value=data["pet_name"],
-                                     key="pet_name_input")
-        if new_pet_name and new_pet_name != data["pet_name"]:
+        # Pet Name Change (in a form so typing doesn't trigger reruns)
+        with st.form("pet_name_form"):
+            new_pet_name = st.text_input("Change Pet's Name:",
+                                         value=data["pet_name"],
+                                         key="pet_name_input")
+            pet_name_submitted = st.form_submit_button("Save Name")
+
+        if pet_name_submitted and new_pet_name and new_pet_name != data[
+                "pet_name"]:
             data["pet_name"] = new_pet_name
             _save_data(data)
             st.session_state.app_data = data